@@ -1,15 +1,36 @@
 # Import libraries
 import os  # For operating system-related tasks, such as reading environment variables
 import time  # For adding delays between retries during S3 uploads
+import random  # For jittering the delays between retries
 import logging  # For logging pipeline progress and errors
+import functools  # For caching the SNS client and environment validation
+import gzip  # For compressing the processed data before upload
+import shutil  # For streaming data between file objects
 import requests  # For making API requests
-import pandas as pd  # For data processing and manipulation
 import boto3  # AWS SDK for interacting with S3 and other AWS services.
+from boto3.exceptions import S3UploadFailedError  # Raised by managed (multipart) S3 uploads
+from boto3.s3.transfer import TransferConfig  # Multipart upload settings
+from botocore.config import Config  # Connection pool and retry settings for AWS clients
 from botocore.exceptions import BotoCoreError, ClientError  # Handle AWS S3-specific errors
-from io import StringIO  # For handling in-memory text streams (e.g., saving processed data)
+from enum import IntEnum  # For upload status codes
+from io import BufferedReader, BytesIO  # For handling in-memory streams (e.g., saving processed data)
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson  # Fast JSON parser for the whole-response fallback used when ijson is absent
+    _json_loads = orjson.loads
+except ImportError:  # Fall back to the standard library (e.g., when the layer does not ship orjson)
+    import json
+    _json_loads = json.loads
+
+try:
+    import ijson  # Incremental JSON parser for streaming the API response
+    _JSON_ERRORS = (ValueError, ijson.JSONError)
+except ImportError:  # Fall back to parsing the whole response (e.g., when the layer does not ship ijson)
+    ijson = None
+    _JSON_ERRORS = (ValueError,)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -18,165 +39,357 @@ logging.basicConfig(
         logging.StreamHandler()  # Stream logs to console (useful for Lambda monitoring)
     ]
 )
+# Messages use lazy %-style arguments, so they are only formatted when the level is enabled
+logger = logging.getLogger(__name__)
+
+# Initialize AWS clients once per execution environment so warm invocations
+# reuse the session, credentials, and pooled connections
+_session = boto3.session.Session()
+_S3_CLIENT = _session.client(
+    "s3",
+    config=Config(
+        max_pool_connections=50,
+        retries={"max_attempts": 5, "mode": "adaptive"},
+        tcp_keepalive=True
+    )
+)
+
+
+@functools.cache
+def _sns_client():
+    """
+    Returns the SNS client, creating it on first use so it is never built when SNS_TOPIC_ARN is unset.
+    """
+    return _session.client("sns")
+
+
+# Switch to concurrent multipart uploads for files larger than 8 MB
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True
+)
+
+# Initialize the HTTP session once so warm invocations reuse pooled keep-alive connections
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        max_retries=Retry(
+            total=3,
+            backoff_factor=2,  # Exponential backoff (2s, 4s, 8s)
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["GET"]  # Only retry GET requests
+        ),
+        pool_connections=10,
+        pool_maxsize=10
+    )
+)
 
 # ----------------------------
 # Step 1: Fetch Data from API
 # ----------------------------
+def is_selected(record):
+    """
+    Decides whether a record is kept. Example: only include products with a price greater than 50.
+
+    Args:
+        record (dict): A single record from the API data.
+
+    Returns:
+        bool: True if the record should be kept.
+    """
+    return (record.get("price") or 0) > 50
+
+
 def fetch_data_with_retry(api_url):
     """
-    Fetches data from a specified API endpoint with retry logic.
+    Fetches data from a specified API endpoint with retry logic, keeping only the records that pass is_selected.
+
+    The response is parsed as a stream (when ijson is available), so rejected records are
+    never held in memory.
 
     Args:
         api_url (str): The URL of the API to fetch data from.
 
     Returns:
-        list or None: A list of dictionaries containing the data from the API, or None if an error occurs.
+        tuple: (selected records, number of records in the response, first record in the response),
+        or (None, 0, None) if an error occurs.
     """
-    session = requests.Session()
-    retries = Retry(
-        total=3,
-        backoff_factor=2,  # Exponential backoff (2s, 4s, 8s)
-        status_forcelist=[500, 502, 503, 504],
-        allowed_methods=["GET"]  # Only retry GET requests
-    )
-    session.mount("https://", HTTPAdapter(max_retries=retries))
-
     try:
-        logging.info("📡 Fetching data from API...")
-        response = session.get(api_url, timeout=10)
+        logger.info("📡 Fetching data from API...")
+        response = _HTTP_SESSION.get(api_url, timeout=10, stream=True)
         response.raise_for_status()  # Raise exception for 4xx/5xx responses
-        logging.info(f"✅ Data fetched successfully! Status Code: {response.status_code}")
-
-        # Validate response is JSON
-        try:
-            return response.json()
-        except ValueError:
-            logging.error("❌ API response is not valid JSON. Returning None.")
-            return None
+        logger.info("✅ Data fetched successfully! Status Code: %s", response.status_code)
+
+        # Parse and filter the response in a single pass, returning the connection to the pool afterwards
+        with response:
+            try:
+                if ijson is not None:
+                    response.raw.decode_content = True  # Undo any gzip/deflate Content-Encoding
+                    response.raw.auto_close = False  # Let the BufferedReader see EOF instead of a closed file
+                    stream = BufferedReader(response.raw)
+                    # Reject non-array bodies (e.g., {"error": ...}) instead of streaming zero items from them
+                    if not stream.peek().lstrip().startswith(b"["):
+                        raise ValueError("Expected a JSON array of records")
+                    items = ijson.items(stream, "item", use_float=True)
+                else:
+                    items = _json_loads(response.content)
+                    if not isinstance(items, list):
+                        raise ValueError("Expected a JSON array of records")
+                # Keep the first record even if it is rejected, so an empty selection still has a header
+                records, item_count, first_record = [], 0, None
+                for item_count, record in enumerate(items, start=1):
+                    if item_count == 1:
+                        first_record = record
+                    if is_selected(record):
+                        records.append(record)
+            except _JSON_ERRORS:
+                logger.error("❌ API response is not a valid JSON array. Returning None.")
+                return None, 0, None
+
+        logger.info("🔄 Filtered Data (Price > 50): %s of %s rows", len(records), item_count)
+        return records, item_count, first_record
 
     except requests.exceptions.ConnectionError:
-        logging.error("❌ Network error! Could not connect to the API. Check the API URL and internet connection.")
+        logger.error("❌ Network error! Could not connect to the API. Check the API URL and internet connection.")
     except requests.exceptions.Timeout:
-        logging.error("⏳ Request timed out! The API took too long to respond.")
+        logger.error("⏳ Request timed out! The API took too long to respond.")
     except requests.exceptions.HTTPError as e:
         if e.response is not None:  # Ensure response exists
-            logging.error(f"❌ HTTP error {e.response.status_code}: {e.response.text}")
+            logger.error("❌ HTTP error %s: %s", e.response.status_code, e.response.text)
         else:
-            logging.error(f"❌ HTTP error occurred: {e}")
+            logger.error("❌ HTTP error occurred: %s", e)
     except requests.exceptions.RequestException as e:
-        logging.error(f"❌ Request failed: {e}")
+        logger.error("❌ Request failed: %s", e)
     except Exception as e:
-        logging.error(f"❌ Unexpected error occurred: {e}")
+        logger.error("❌ Unexpected error occurred: %s", e)
 
-    return None
+    return None, 0, None
 
 
-# ---------------------------------
-# Step 2: Process the Data (Pandas)
-# ---------------------------------
-def process_data(data):
+# ----------------------------------
+# Step 2: Process the Data (PyArrow)
+# ----------------------------------
+
+# Supported values of the optional OUTPUT_FORMAT environment variable
+OUTPUT_FORMATS = ("txt", "parquet")
+
+
+def records_to_table(data, header_record=None):
+    """
+    Builds an Arrow table whose columns are the union of the keys of all records, like
+    pandas.DataFrame does (pyarrow.Table.from_pylist would only keep the first record's keys).
+
+    Args:
+        data (list): Selected data as a list of dictionaries.
+        header_record (dict): Record to take the columns from when data is empty.
+
+    Returns:
+        pyarrow.Table: The records as a table (empty, with header_record's columns, if data is empty).
     """
-    Processes the raw data into a filtered and structured TXT format.
+    import pyarrow as pa
+
+    if data:
+        return pa.Table.from_struct_array(pa.array(data))
+    return pa.Table.from_struct_array(pa.array([header_record])).slice(0, 0)
+
+
+def write_txt(data, header_record=None):
+    """
+    Writes the data as a tab-separated TXT file with the vectorized Arrow CSV writer.
 
     Args:
-        data (list): Raw data as a list of dictionaries.
+        data (list): Selected data as a list of dictionaries.
+        header_record (dict): Record to take the columns from when data is empty.
 
     Returns:
-        StringIO: An in-memory file object containing the processed TXT data, or None if an error occurs.
+        pyarrow.BufferReader: An in-memory file object containing the processed TXT data.
+    """
+    # PyArrow is imported on first use (and then cached in sys.modules),
+    # so invocations that fail before the Process Data stage never pay for importing it
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    table = records_to_table(data, header_record)
+
+    # The CSV writer cannot serialize nested objects, so expand them into
+    # dotted columns (e.g., rating -> rating.rate, rating.count)
+    while any(pa.types.is_struct(field.type) for field in table.schema):
+        table = table.flatten()
+
+    # Save the filtered data to an in-memory TXT file
+    sink = pa.BufferOutputStream()
+    pacsv.write_csv(table, sink, pacsv.WriteOptions(delimiter="\t"))
+    return pa.BufferReader(sink.getvalue())  # Reads the Arrow buffer in place, without a copy
+
+
+def write_parquet(data, header_record=None):
+    """
+    Writes the data as a Snappy-compressed Parquet file.
+
+    Args:
+        data (list): Selected data as a list of dictionaries.
+        header_record (dict): Record to take the schema from when data is empty.
+
+    Returns:
+        pyarrow.BufferReader: An in-memory file object containing the processed Parquet data.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # Parquet stores nested objects natively, so no flattening is needed
+    table = records_to_table(data, header_record)
+
+    # Save the filtered data to an in-memory Parquet file
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink, compression="snappy", use_dictionary=True)
+    return pa.BufferReader(sink.getvalue())  # Reads the Arrow buffer in place, without a copy
+
+
+def process_data(data, output_format="txt", header_record=None):
+    """
+    Processes the selected data into a structured TXT or Parquet format.
+
+    Args:
+        data (list): Selected data as a list of dictionaries.
+        output_format (str): Output format, one of OUTPUT_FORMATS ("txt" or "parquet").
+        header_record (dict): Record to take the columns from when no records were selected,
+            so an empty selection still produces a header-only file.
+
+    Returns:
+        pyarrow.BufferReader: An in-memory file object containing the processed data, or None if an error occurs.
     """
     try:
-        # Validate that data is not empty
-        if not data:
+        # Validate that there is data, or at least a record to describe the columns
+        if not data and header_record is None:
             raise ValueError("No data provided for processing")
 
-        # Convert the data into a Pandas DataFrame
-        df = pd.DataFrame(data)
-        logging.info("🔄 Original Data:")
-        logging.info(df.head().to_string())
-
-        # Filter: Example - Only include products with a price greater than 50
-        df_filtered = df[df['price'] > 50]
-        logging.info("🔄 Filtered Data (Price > 50):")
-        logging.info(df_filtered.head().to_string())
-
-        # Save the filtered data to an in-memory TXT file
-        txt_buffer = StringIO()
-        df_filtered.to_csv(txt_buffer, sep="\t", index=False)
-        logging.info("✅ Data processed and saved to TXT format!")
-        return txt_buffer
+        if output_format == "parquet":
+            buffer = write_parquet(data, header_record)
+        else:
+            buffer = write_txt(data, header_record)
+        logger.info("✅ Data processed and saved to %s format!", output_format.upper())
+        return buffer
     except ValueError as e:
-        logging.error(f"❌ ValueError: {e}")
+        logger.error("❌ ValueError: %s", e)
     except Exception as e:
-        logging.error(f"❌ An unexpected error occurred while processing data: {e}")
+        logger.error("❌ An unexpected error occurred while processing data: %s", e)
     return None
 
 
-# --------------------------------------
-# Step 3: Upload the TXT to an S3 Bucket
-# --------------------------------------
-def upload_to_s3(txt_buffer, bucket_name, s3_key, retries=3, delay=5):
+def compress_data(txt_buffer):
     """
-    Uploads the processed TXT data to an S3 bucket with retry logic.
+    Gzip-compresses the processed TXT data to reduce the bytes uploaded to and stored in S3.
 
     Args:
-        txt_buffer (StringIO): In-memory buffer containing TXT data to upload.
+        txt_buffer (pyarrow.BufferReader): In-memory file object containing the processed TXT data.
+
+    Returns:
+        BytesIO: An in-memory file object containing the gzip-compressed TXT data.
+    """
+    gz_buffer = BytesIO()
+    # Stream the data into the compressor in chunks instead of copying the whole payload.
+    # Level 1 trades a little compression ratio for much faster compression
+    txt_buffer.seek(0)
+    with gzip.GzipFile(fileobj=gz_buffer, mode="wb", compresslevel=1) as gz:
+        shutil.copyfileobj(txt_buffer, gz)
+    logger.info("🗜️ TXT data compressed: %s -> %s bytes", txt_buffer.tell(), gz_buffer.tell())
+    return gz_buffer
+
+
+# ---------------------------------------
+# Step 3: Upload the Data to an S3 Bucket
+# ---------------------------------------
+class UploadStatus(IntEnum):
+    """
+    Result of an S3 upload.
+    """
+    OK = 0
+    FAIL = 1
+
+
+def upload_to_s3(data_buffer, bucket_name, s3_key, retries=3, backoff_base=0.5, backoff_cap=20,
+                 content_type="text/plain", content_encoding=None):
+    """
+    Uploads the processed data to an S3 bucket with retry logic.
+
+    Args:
+        data_buffer (BytesIO or pyarrow.BufferReader): In-memory file object containing the processed
+            data to upload. It is streamed to S3 as-is, without copying it into a single bytes object.
         bucket_name (str): Name of the S3 bucket.
         s3_key (str): S3 key (path) where the file will be uploaded.
         retries (int): Number of retry attempts for failed uploads.
-        delay (int): Delay (in seconds) between retry attempts.
+        backoff_base (float): Base delay (in seconds) of the exponential backoff between retry attempts.
+        backoff_cap (float): Maximum delay (in seconds) between retry attempts.
+        content_type (str): Content-Type of the data (e.g., "text/plain").
+        content_encoding (str): Optional Content-Encoding of the data (e.g., "gzip").
 
     Returns:
-        str: "upload_successful" or "upload_failed"
+        UploadStatus: UploadStatus.OK or UploadStatus.FAIL
     """
+    extra_args = {"ContentType": content_type}
+    if content_encoding:
+        extra_args["ContentEncoding"] = content_encoding
+
     for attempt in range(1, retries + 1):
         try:
             # Reset buffer position
-            txt_buffer.seek(0)
-
-            # Initialize S3 client
-            s3_client = boto3.client('s3')
-
-            # Upload the file
-            s3_client.put_object(
-                Bucket=bucket_name,
-                Key=s3_key,
-                Body=txt_buffer.getvalue(),
-                ContentType='text/plain'
+            data_buffer.seek(0)
+
+            # Upload the file (large files are split into parallel multipart uploads)
+            _S3_CLIENT.upload_fileobj(
+                data_buffer,
+                bucket_name,
+                s3_key,
+                Config=_TRANSFER_CONFIG,
+                ExtraArgs=extra_args
             )
-            logging.info(f"✅ File successfully uploaded to S3: s3://{bucket_name}/{s3_key}")
-            return "upload_successful"
-        except (BotoCoreError, ClientError) as e:
-            logging.error(f"❌ Upload attempt {attempt} failed: {e}")
+            logger.info("✅ File successfully uploaded to S3: s3://%s/%s", bucket_name, s3_key)
+            return UploadStatus.OK
+        except (BotoCoreError, ClientError, S3UploadFailedError) as e:
+            logger.error("❌ Upload attempt %s failed: %s", attempt, e)
             if attempt < retries:
-                logging.info(f"🔄 Retrying in {delay} seconds...")
-                logging.warning(f"🔄 Retrying upload attempt {attempt + 1} in {delay} seconds...")
+                # Exponential backoff with full jitter so concurrent invocations don't retry in lockstep
+                delay = random.uniform(0, min(backoff_cap, backoff_base * 2 ** (attempt - 1)))
+                logger.info("🔄 Retrying in %.2f seconds...", delay)
+                logger.warning("🔄 Retrying upload attempt %s in %.2f seconds...", attempt + 1, delay)
                 time.sleep(delay)
-            else:
-                logging.error("❌ All retry attempts failed. Giving up.")
-                return "upload_failed"
+
+    logger.error("❌ All retry attempts failed. Giving up.")
+    return UploadStatus.FAIL
 
 
 # ----------------------------------------------
 # Step 4: AWS Lambda Handler and helper function
 # ----------------------------------------------
 
+@functools.lru_cache(maxsize=4)
 def validate_environment_vars(required_vars):
     """
-    Validates the presence of required environment variables.
+    Validates the presence of required environment variables. Lambda environment variables are
+    fixed for the lifetime of the execution environment, so results are memoized per tuple of names.
 
     Args:
-        required_vars (list): A list of required environment variable names.
+        required_vars (tuple): The required environment variable names (a tuple, so it can be cached).
 
     Returns:
         dict: A dictionary of environment variable values, or None if a variable is missing.
     """
     missing_vars = [var for var in required_vars if not os.getenv(var)]
     if missing_vars:
-        logging.error(f"❌ Missing environment variables: {', '.join(missing_vars)}")
+        logger.error("❌ Missing environment variables: %s", ', '.join(missing_vars))
         return None
     return {var: os.getenv(var) for var in required_vars}
 
 
+# Validate the environment once at cold start; invocations then hit the cache
+REQUIRED_ENV_VARS = ("API_URL", "S3_BUCKET", "S3_KEY", "SNS_TOPIC_ARN")
+validate_environment_vars(REQUIRED_ENV_VARS)
+_OUTPUT_FORMAT = os.getenv("OUTPUT_FORMAT", "txt").lower()
+
+
 def lambda_handler(event, context):
     """
     AWS Lambda entry point for the data pipeline.
@@ -185,27 +398,40 @@ def lambda_handler(event, context):
         event: AWS Lambda event object (not used here).
         context: AWS Lambda context object (not used here).
     """
-    logging.info("🚀 Starting the AWS S3 pipeline...")
-
-    # Read environment variables
-    api_url = os.getenv("API_URL")
-    s3_bucket = os.getenv("S3_BUCKET")
-    s3_key = os.getenv("S3_KEY")
+    logger.info("🚀 Starting the AWS S3 pipeline...")
 
-    # Validate required environment variables
-    env_vars = validate_environment_vars(["API_URL", "S3_BUCKET", "S3_KEY", "SNS_TOPIC_ARN"])
+    # Validate required environment variables (memoized after the cold start check)
+    env_vars = validate_environment_vars(REQUIRED_ENV_VARS)
     if not env_vars:
-        notify_failure("❌ Missing required environment variables.")
+        # The cached validation only logs the missing names once, so name them on every failed invocation
+        missing_vars = [var for var in REQUIRED_ENV_VARS if not os.getenv(var)]
+        error_message = f"❌ Missing required environment variables: {', '.join(missing_vars)}."
+        logger.error(error_message)
+        notify_failure(error_message)
         return {
             "statusCode": 500,
             "body": "Missing required environment variables."
         }
+    api_url = env_vars["API_URL"]
+    s3_bucket = env_vars["S3_BUCKET"]
+    s3_key = env_vars["S3_KEY"]
+    output_format = _OUTPUT_FORMAT
+
+    # Validate the optional output format
+    if output_format not in OUTPUT_FORMATS:
+        error_message = f"❌ Unsupported OUTPUT_FORMAT '{output_format}'. Expected one of: {', '.join(OUTPUT_FORMATS)}."
+        logger.error(error_message)
+        notify_failure(error_message)
+        return {
+            "statusCode": 500,
+            "body": "Unsupported output format."
+        }
 
-    # Step 1: Fetch the data
-    raw_data = fetch_data_with_retry(api_url)
-    if not raw_data:
+    # Step 1: Fetch the data (filtered while it is parsed)
+    records, item_count, first_record = fetch_data_with_retry(api_url)
+    if not item_count:
         error_message = "❌ Data pipeline failed at the Fetch Data stage."
-        logging.error(error_message)
+        logger.error(error_message)
         notify_failure(error_message)
         return {
             "statusCode": 500,
@@ -213,35 +439,47 @@ def lambda_handler(event, context):
         }
 
     # Step 2: Process the data
-    txt_buffer = process_data(raw_data)
-    if not txt_buffer:
+    data_buffer = process_data(records, output_format, header_record=first_record)
+    if data_buffer is None:
         error_message = "❌ Data pipeline failed at the Process Data stage."
-        logging.error(error_message)
+        logger.error(error_message)
         notify_failure(error_message)
         return {
             "statusCode": 500,
             "body": "Data processing failed."
         }
 
+    if output_format == "parquet":
+        # Parquet is already Snappy-compressed, so store it as-is under a .parquet key
+        s3_key = f"{os.path.splitext(s3_key)[0]}.parquet"
+        content_type, content_encoding = "application/octet-stream", None
+    else:
+        # Compress the TXT data and store it under a .gz key
+        data_buffer = compress_data(data_buffer)
+        if not s3_key.endswith(".gz"):
+            s3_key = f"{s3_key}.gz"
+        content_type, content_encoding = "text/plain", "gzip"
+
     # Step 3: Upload to S3
-    upload_status = upload_to_s3(txt_buffer, s3_bucket, s3_key)
-    if upload_status == "upload_failed":
+    upload_status = upload_to_s3(
+        data_buffer, s3_bucket, s3_key, content_type=content_type, content_encoding=content_encoding
+    )
+    if upload_status is UploadStatus.FAIL:
         error_message = "❌ Data pipeline failed during S3 upload."
-        logging.error(error_message)
+        logger.error(error_message)
         notify_failure(error_message)
         return {
             "statusCode": 500,
             "body": "S3 upload failed."
         }
 
-    if upload_status == "upload_successful":
-        success_message = "🏁 ✅ All pipeline processes completed successfully!"
-        logging.info(success_message)
-        notify_success(success_message)
-        return {
-            "statusCode": 200,
-            "body": "Pipeline completed successfully."
-        }
+    success_message = "🏁 ✅ All pipeline processes completed successfully!"
+    logger.info(success_message)
+    notify_success(success_message)
+    return {
+        "statusCode": 200,
+        "body": "Pipeline completed successfully."
+    }
 
 
 # --------------------------------------------------------
@@ -254,24 +492,22 @@ def notify_failure(message):
     Args:
         message (str): The message to send to the SNS topic.
     """
-    try:
-        sns_client = boto3.client('sns')
-        sns_topic_arn = os.getenv("SNS_TOPIC_ARN")
-
-        # Validate the Topic ARN
-        if not sns_topic_arn:
-            logging.error("❌ SNS_TOPIC_ARN is not set. Cannot send failure notification.")
-            return
+    # Validate the Topic ARN before touching SNS
+    sns_topic_arn = os.getenv("SNS_TOPIC_ARN")
+    if not sns_topic_arn:
+        logger.error("❌ SNS_TOPIC_ARN is not set. Cannot send failure notification.")
+        return
 
+    try:
         # Publish the failure notification
-        response = sns_client.publish(
+        response = _sns_client().publish(
             TopicArn=sns_topic_arn,
             Message=message,
             Subject="Data Pipeline Failure Notification"
         )
-        logging.info(f"✅ Failure notification sent: {response['MessageId']}")
+        logger.info("✅ Failure notification sent: %s", response['MessageId'])
     except Exception as e:
-        logging.error(f"❌ Failed to send SNS notification: {e}")
+        logger.error("❌ Failed to send SNS notification: %s", e)
 
 
 def notify_success(message):
@@ -280,22 +516,65 @@ def notify_success(message):
     Args:
         message (str): The message to send to the SNS topic.
     """
-    try:
-        sns_client = boto3.client('sns')
-        sns_topic_arn = os.getenv("SNS_TOPIC_ARN")
-
-        # Validate the Topic ARN
-        if not sns_topic_arn:
-            logging.error("❌ SNS_TOPIC_ARN is not set. Cannot send success notification.")
-            return
+    # Validate the Topic ARN before touching SNS
+    sns_topic_arn = os.getenv("SNS_TOPIC_ARN")
+    if not sns_topic_arn:
+        logger.error("❌ SNS_TOPIC_ARN is not set. Cannot send success notification.")
+        return
 
+    try:
         # Publish the success notification
-        response = sns_client.publish(
+        response = _sns_client().publish(
             TopicArn=sns_topic_arn,
             Message=message,
             Subject="Data Pipeline Success Notification"
         )
-        logging.info(f"✅ Success notification sent: {response['MessageId']}")
+        logger.info("✅ Success notification sent: %s", response['MessageId'])
     except Exception as e:
-        logging.error(f"❌ Failed to send SNS success notification: {e}")
+        logger.error("❌ Failed to send SNS success notification: %s", e)
+
+
+# -------------------------------------------------------------
+# Cold Start: Prime connections before the first invocation
+# -------------------------------------------------------------
+
+def warm_up_connections():
+    """
+    Opens the API and S3 connections ahead of the first invocation, so DNS lookups,
+    TLS handshakes, and AWS credential resolution are paid during the init phase.
+    Failures are logged and ignored; the handler reports any real problem.
+    """
+    env_vars = validate_environment_vars(REQUIRED_ENV_VARS)
+    if not env_vars:
+        return
+
+    # Open the connection in the session's own pool, so the first fetch reuses the warm keep-alive
+    # socket, but without the adapter's retry policy, which would turn an unreachable API into
+    # several backed-off attempts during init
+    try:
+        request = requests.Request("HEAD", env_vars["API_URL"]).prepare()
+        adapter = _HTTP_SESSION.get_adapter(request.url)
+        # Resolve proxies and certificates (e.g., REQUESTS_CA_BUNDLE) the way the session does for the fetch
+        settings = _HTTP_SESSION.merge_environment_settings(request.url, {}, None, None, None)
+        if hasattr(adapter, "get_connection_with_tls_context"):  # requests >= 2.32.2 keys pools by TLS settings
+            pool = adapter.get_connection_with_tls_context(
+                request, settings["verify"], settings["proxies"], settings["cert"]
+            )
+        else:
+            pool = adapter.get_connection(request.url, settings["proxies"])
+            adapter.cert_verify(pool, request.url, settings["verify"], settings["cert"])
+        pool.urlopen("HEAD", request.path_url, retries=False, timeout=2)
+    except Exception as e:
+        logger.warning("⚠️ Could not warm up the API connection: %s", e)
+
+    try:
+        _S3_CLIENT.head_bucket(Bucket=env_vars["S3_BUCKET"])
+    except Exception as e:
+        logger.warning("⚠️ Could not warm up the S3 connection: %s", e)
+
 
+# Only warm up for provisioned concurrency, where init runs ahead of traffic. On-demand cold
+# starts would just add a round-trip to the first request, and SnapStart restores a snapshot
+# whose open sockets are stale, so a connection warmed during its init is not reused.
+if os.getenv("AWS_LAMBDA_INITIALIZATION_TYPE") == "provisioned-concurrency":
+    warm_up_connections()
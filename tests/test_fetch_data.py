@@ -0,0 +1,95 @@
+import gzip
+import io
+
+import pytest
+
+pytest.importorskip("boto3")
+requests = pytest.importorskip("requests")
+urllib3 = pytest.importorskip("urllib3")
+
+import main  # noqa: E402
+
+
+API_URL = "https://api.example.com/products"
+
+PRODUCTS = b'[{"id": 1, "price": 10.5}, {"id": 2, "price": 60}, {"id": 3, "price": 99.99, "rating": {"rate": 4.1}}]'
+
+
+@pytest.fixture(params=["ijson", "json"])
+def parser(request, monkeypatch):
+    """
+    Runs each test with the streaming ijson parser and with the whole-response fallback.
+    """
+    if request.param == "ijson":
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(main, "ijson", None)
+        monkeypatch.setattr(main, "_JSON_ERRORS", (ValueError,))
+    return request.param
+
+
+def serve(monkeypatch, body, headers=None):
+    """
+    Makes the module HTTP session answer every GET with the given body.
+    """
+    def get(url, **kwargs):
+        raw = urllib3.HTTPResponse(
+            body=io.BytesIO(body), headers=headers or {}, status=200, preload_content=False
+        )
+        return requests.adapters.HTTPAdapter().build_response(requests.Request("GET", url).prepare(), raw)
+
+    monkeypatch.setattr(main._HTTP_SESSION, "get", get)
+
+
+def test_fetch_returns_selected_records_count_and_first_record(monkeypatch, parser):
+    serve(monkeypatch, PRODUCTS)
+    records, item_count, first_record = main.fetch_data_with_retry(API_URL)
+    assert records == [{"id": 2, "price": 60}, {"id": 3, "price": 99.99, "rating": {"rate": 4.1}}]
+    assert item_count == 3
+    assert first_record == {"id": 1, "price": 10.5}
+
+
+def test_fetch_decodes_gzip_content_encoding(monkeypatch, parser):
+    serve(monkeypatch, gzip.compress(PRODUCTS), {"Content-Encoding": "gzip"})
+    records, item_count, _ = main.fetch_data_with_retry(API_URL)
+    assert [record["id"] for record in records] == [2, 3]
+    assert item_count == 3
+
+
+@pytest.mark.parametrize("body", [b'{"error": "rate limited"}', b"  \n null", b"", b"[{"])
+def test_fetch_rejects_bodies_that_are_not_json_arrays(monkeypatch, parser, body):
+    serve(monkeypatch, body)
+    assert main.fetch_data_with_retry(API_URL) == (None, 0, None)
+
+
+def test_fetch_empty_array_has_no_items(monkeypatch, parser):
+    serve(monkeypatch, b" []")
+    assert main.fetch_data_with_retry(API_URL) == ([], 0, None)
+
+
+def test_handler_uploads_header_only_file_for_empty_selection(monkeypatch, parser):
+    pytest.importorskip("pyarrow")
+    serve(monkeypatch, b'[{"id": 1, "price": 10.5, "rating": {"rate": 4.1}}]')
+    uploads = []
+    monkeypatch.setattr(main, "validate_environment_vars", lambda required_vars: {
+        "API_URL": API_URL, "S3_BUCKET": "bucket", "S3_KEY": "products.txt", "SNS_TOPIC_ARN": None
+    })
+    monkeypatch.setattr(main, "notify_success", lambda message: None)
+    monkeypatch.setattr(main, "upload_to_s3", lambda data_buffer, bucket_name, s3_key, **kwargs: uploads.append(
+        (s3_key, gzip.decompress(data_buffer.getvalue()))
+    ) or main.UploadStatus.OK)
+
+    assert main.lambda_handler({}, None)["statusCode"] == 200
+    assert uploads == [("products.txt.gz", b'"id"\t"price"\t"rating.rate"\n')]
+
+
+def test_handler_fails_at_fetch_stage_for_empty_array(monkeypatch, parser):
+    serve(monkeypatch, b"[]")
+    monkeypatch.setattr(main, "validate_environment_vars", lambda required_vars: {
+        "API_URL": API_URL, "S3_BUCKET": "bucket", "S3_KEY": "products.txt", "SNS_TOPIC_ARN": None
+    })
+    failures = []
+    monkeypatch.setattr(main, "notify_failure", failures.append)
+
+    assert main.lambda_handler({}, None) == {"statusCode": 500, "body": "Data fetch failed."}
+    assert failures == ["❌ Data pipeline failed at the Fetch Data stage."]
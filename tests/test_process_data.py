@@ -0,0 +1,59 @@
+import pytest
+
+pytest.importorskip("boto3")
+pytest.importorskip("requests")
+pytest.importorskip("pyarrow")
+
+import main  # noqa: E402
+
+
+RECORDS = [
+    {
+        "id": 1,
+        "title": 'Backpack "Fjallraven"\tfits 15" laptops',
+        "price": 109.95,
+        "in_stock": True,
+        "discount": None,
+        "rating": None,  # A null nested object must not hide later rating.* values
+    },
+    {
+        "id": 2,
+        "title": "Slim Fit T-Shirt\nmulti-line",
+        "price": 695,
+        "in_stock": False,
+        "discount": 0.0000015,
+        "rating": {"rate": 4.1},
+    },
+    {
+        "id": 3,
+        "title": "",
+        "price": 60.0,
+        "in_stock": True,
+        "discount": 1.5e20,
+        "rating": {"rate": -0.0, "count": 0},  # rating.count first appears here
+    },
+    {"id": 4, "title": "Missing fields", "price": 1234567890.5, "category": "jewelery"},  # Key missing from id 1
+]
+
+HEADER = b'"id"\t"title"\t"price"\t"in_stock"\t"discount"\t"rating.rate"\t"rating.count"\t"category"\n'
+
+
+def test_write_txt_keeps_every_column():
+    assert main.write_txt(RECORDS).read() == (
+        HEADER
+        + b'1\t"Backpack ""Fjallraven""\tfits 15"" laptops"\t109.95\ttrue\t\t\t\t\n'
+        + b'2\t"Slim Fit T-Shirt\nmulti-line"\t695\tfalse\t0.0000015\t4.1\t\t\n'
+        + b'3\t""\t60\ttrue\t1.5e+20\t-0\t0\t\n'
+        + b'4\t"Missing fields"\t1234567890.5\t\t\t\t\t"jewelery"\n'
+    )
+
+
+def test_write_txt_empty_selection_writes_header_only():
+    assert main.write_txt([], header_record=RECORDS[2]).read() == HEADER.replace(b'\t"category"', b"")
+
+
+def test_write_parquet_keeps_every_column():
+    pq = pytest.importorskip("pyarrow.parquet")
+    table = pq.read_table(main.write_parquet(RECORDS))
+    assert table.column_names == ["id", "title", "price", "in_stock", "discount", "rating", "category"]
+    assert table.column("category").to_pylist() == [None, None, None, "jewelery"]